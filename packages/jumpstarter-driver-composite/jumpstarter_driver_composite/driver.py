@@ -1,5 +1,4 @@
 from dataclasses import field
-from functools import reduce
 
 from pydantic.dataclasses import dataclass
 
@@ -22,6 +21,13 @@ class Composite(CompositeInterface, Driver):
 class Proxy(Driver):
     ref: str
     _proxy_target: Driver | None = field(default=None, init=False, repr=False)
+    _proxy_path: tuple[str, ...] = field(default=(), init=False, repr=False)
+
+    def __post_init__(self):
+        if hasattr(super(), "__post_init__"):
+            super().__post_init__()
+
+        self._proxy_path = tuple(self.ref.split("."))
 
     @classmethod
     def client(cls) -> str:
@@ -30,14 +36,15 @@ class Proxy(Driver):
     def _resolve_proxy_target(self, root, name):
         if self._proxy_target:
             return self._proxy_target
-        try:
-            path = self.ref.split(".")
-            if not path:
-                raise ConfigurationError(f"Proxy driver {name} has empty path")
-            self._proxy_target = reduce(lambda instance, name: instance.children[name], path, root)
-            return self._proxy_target
-        except KeyError:
-            raise ConfigurationError(f"Proxy driver {name} references nonexistent driver {self.ref}") from None
+        if not self._proxy_path:
+            raise ConfigurationError(f"Proxy driver {name} has empty path")
+        instance = root
+        for child in self._proxy_path:
+            instance = instance.children.get(child)
+            if instance is None:
+                raise ConfigurationError(f"Proxy driver {name} references nonexistent driver {self.ref}")
+        self._proxy_target = instance
+        return self._proxy_target
 
     def report(self, *, parent=None, name=None):
         if not self._proxy_target:
@@ -1,7 +1,9 @@
+import pytest
 from jumpstarter_driver_power.driver import MockPower
 from pydantic.dataclasses import dataclass
 
 from .driver import Composite, Proxy
+from jumpstarter.common.exceptions import ConfigurationError
 from jumpstarter.common.utils import serve
 from jumpstarter.driver import Driver, export
 
@@ -60,6 +62,18 @@ def test_drivers_composite():
         client.proxy1.power1.on()
 
 
+def test_proxy_nonexistent_ref():
+    composite = Composite(
+        children={
+            "proxy": Proxy(ref="composite1.missing"),
+            "composite1": Composite(children={"power1": MockPower()}),
+        }
+    )
+
+    with pytest.raises(ConfigurationError, match="references nonexistent driver composite1.missing"):
+        composite.enumerate()
+
+
 def test_proxy_method_forwarding():
     """Test that Proxy forwards method calls to target driver"""
     # Server-side test: verify __getattr__ works on Proxy
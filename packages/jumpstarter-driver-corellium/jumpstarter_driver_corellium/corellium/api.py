@@ -1,3 +1,4 @@
+import time
 from typing import Optional
 
 import requests
@@ -13,6 +14,9 @@ class ApiClient:
     """
     req: requests.Session
 
+    # how long (in seconds) fetched projects and device models are reused
+    cache_ttl: float = 30.0
+
     def __init__(self, host: str, token: str) -> None:
         """
         Initializes a new client using the API token
@@ -22,6 +26,10 @@ class ApiClient:
         self.token = token
         self.req = requests.Session()
         self.req.headers.update({'Authorization': f'Bearer {self.token}'})
+        self._projects: dict[str, Project] = {}
+        self._projects_expiry = 0.0
+        self._devices: dict[str, dict] = {}
+        self._devices_expiry = 0.0
 
     @property
     def baseurl(self) -> str:
@@ -33,7 +41,13 @@ class ApiClient:
     def get_project(self, project_ref: str = 'Default Project') -> Optional[Project]:
         """
         Retrieve a project based on project_ref, which is either its id or name.
+
+        Projects are indexed by id and name and reused for `cache_ttl` seconds,
+        a lookup miss always refreshes the index.
         """
+        if time.monotonic() < self._projects_expiry and project_ref in self._projects:
+            return self._projects[project_ref]
+
         data = None
 
         try:
@@ -45,18 +59,29 @@ class ApiClient:
 
             raise CorelliumApiException(msgerr) from e
 
+        projects = {}
         for project in data:
-            if project['name'] == project_ref or project['id'] == project_ref:
-                return Project(id=project['id'], name=project['name'])
+            item = Project(id=project['id'], name=project['name'])
+            projects.setdefault(item.id, item)
+            projects.setdefault(item.name, item)
 
-        return None
+        self._projects = projects
+        self._projects_expiry = time.monotonic() + self.cache_ttl
+
+        return projects.get(project_ref)
 
     def get_device(self, model: str) -> Optional[Device]:
         """
         Get a device spec from Corellium's list based on the model name.
 
         A device object is used to create a new virtual instance.
+
+        Device specs are indexed by model and reused for `cache_ttl` seconds,
+        a lookup miss always refreshes the index.
         """
+        if time.monotonic() < self._devices_expiry and model in self._devices:
+            return Device(**self._devices[model]) # ty: ignore[missing-argument]
+
         data = None
 
         try:
@@ -68,11 +93,17 @@ class ApiClient:
 
             raise CorelliumApiException(msgerr) from e
 
+        devices = {}
         for device in data:
-            if device['model'] == model:
-                return Device(**device) # ty: ignore[missing-argument]
+            devices.setdefault(device['model'], device)
 
-        return None
+        self._devices = devices
+        self._devices_expiry = time.monotonic() + self.cache_ttl
+
+        if model not in devices:
+            return None
+
+        return Device(**devices[model]) # ty: ignore[missing-argument]
 
     def create_instance(self, name: str, project: Project, device: Device, os_version: str, os_build: str) -> Instance:
         """
@@ -40,6 +40,26 @@ def test_get_project_ok(requests_mock, project_name, data, has_results):
         assert project is None
 
 
+def test_get_project_cached(requests_mock):
+    data = fixture('http/get-projects-200.json')
+    m = requests_mock.get('https://api-host/api/v1/projects', status_code=200, text=data)
+    api = ApiClient('api-host', 'api-token')
+
+    project = api.get_project()
+    assert project is not None
+    assert api.get_project(project.id) == project
+    assert m.call_count == 1
+
+    # a miss always refreshes the cached projects
+    assert api.get_project('notfound') is None
+    assert m.call_count == 2
+
+    # so does an expired cache
+    api._projects_expiry = 0.0
+    assert api.get_project() == project
+    assert m.call_count == 3
+
+
 @pytest.mark.parametrize(
     'status_code,data,msg',
     [
@@ -73,6 +93,19 @@ def test_get_device_ok(requests_mock, model, data, has_results):
         assert device is None
 
 
+def test_get_device_cached(requests_mock):
+    data = fixture('http/get-models-200.json')
+    m = requests_mock.get('https://api-host/api/v1/models', status_code=200, text=data)
+    api = ApiClient('api-host', 'api-token')
+
+    device = api.get_device('rpi4b')
+    assert api.get_device('rpi4b') == device
+    assert m.call_count == 1
+
+    assert api.get_device('notfound') is None
+    assert m.call_count == 2
+
+
 @pytest.mark.parametrize(
     'status_code,data,msg',
     [
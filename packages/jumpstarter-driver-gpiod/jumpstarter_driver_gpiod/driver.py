@@ -8,12 +8,17 @@ try:
 except ImportError:
     gpiod = None
 
-from jumpstarter_driver_power.driver import PowerInterface
+from jumpstarter_driver_power.driver import PowerInterface, power_cycle
 
 from jumpstarter_driver_gpiod.client import PinState
 
 from jumpstarter.driver import Driver, export
 
+# config values mapped to gpiod enum member names, resolved against the (optional) gpiod module on use
+_DRIVES = {None: "PUSH_PULL", "push_pull": "PUSH_PULL", "open_drain": "OPEN_DRAIN", "open_source": "OPEN_SOURCE"}
+_BIASES = {None: "AS_IS", "as_is": "AS_IS", "pull_up": "PULL_UP", "pull_down": "PULL_DOWN", "disabled": "DISABLED"}
+_EDGES = {"rising": "RISING_EDGE", "falling": "FALLING_EDGE"}
+
 
 @dataclass(kw_only=True)
 class _GPIOBase(Driver):
@@ -55,32 +60,15 @@ class _GPIOBase(Driver):
             return PinState.INACTIVE
 
     def _line_settings(self):
-        drive = gpiod.line.Drive.PUSH_PULL
-        bias = gpiod.line.Bias.AS_IS
-
-        if self.drive == "open_drain":
-            drive = gpiod.line.Drive.OPEN_DRAIN
-        elif self.drive in ["push_pull", None]:
-            drive = gpiod.line.Drive.PUSH_PULL
-        elif self.drive == "open_source":
-            drive = gpiod.line.Drive.OPEN_SOURCE
-        else:
+        if self.drive not in _DRIVES:
             raise ValueError(f"Invalid drive: {self.drive}, must be one of: open_drain, push_pull, open_source")
 
-        if self.bias in [None, "as_is"]:
-            bias = gpiod.line.Bias.AS_IS
-        elif self.bias == "pull_up":
-            bias = gpiod.line.Bias.PULL_UP
-        elif self.bias == "pull_down":
-            bias = gpiod.line.Bias.PULL_DOWN
-        elif self.bias == "disabled":
-            bias = gpiod.line.Bias.DISABLED
-        else:
+        if self.bias not in _BIASES:
             raise ValueError(f"Invalid bias: {self.bias}, must be one of: as_is, pull_up, pull_down, disabled")
 
         return gpiod.LineSettings(
-            drive=drive,
-            bias=bias,
+            drive=getattr(gpiod.line.Drive, _DRIVES[self.drive]),
+            bias=getattr(gpiod.line.Bias, _BIASES[self.bias]),
             active_low=self.active_low,
         )
 
@@ -115,15 +103,6 @@ class DigitalOutput(_GPIOBase):
         settings = self._line_settings()
         settings.direction = gpiod.line.Direction.OUTPUT
 
-        if self.drive == "open_drain":
-            settings.drive = gpiod.line.Drive.OPEN_DRAIN
-        elif self.drive in ["push_pull", None]:
-            settings.drive = gpiod.line.Drive.PUSH_PULL
-        elif self.drive == "open_source":
-            settings.drive = gpiod.line.Drive.OPEN_SOURCE
-        else:
-            raise ValueError(f"Invalid drive: {self.drive}, must be one of: " + "open_drain, push_pull, open_source")
-
         if self.initial_value in ["active", "on", True]:
             settings.output_value = gpiod.line.Value.ACTIVE
         elif self.initial_value in ["inactive", "off", False, None]:
@@ -148,6 +127,11 @@ class DigitalOutput(_GPIOBase):
         self._line.set_value(self.line, gpiod.line.Value.ACTIVE)
         self.logger.info(f"line {self.line} ({self._line_name}) on() -> pin reads: {self.read_pin()}")
 
+    @export
+    async def cycle(self, wait: int = 2) -> None:
+        """Set the pin inactive, wait `wait` seconds and set it active again"""
+        await power_cycle(self.off, self.on, wait)
+
 
 @dataclass(kw_only=True)
 class DigitalInput(_GPIOBase):
@@ -190,14 +174,9 @@ class DigitalInput(_GPIOBase):
     @export
     def wait_for_edge(self, edge_type: str, timeout: float | None = None):
         """Block until the line reads high (rising edge)"""
-        edge = None
-        if edge_type == "rising":
-            edge = gpiod.EdgeEvent.Type.RISING_EDGE
-        elif edge_type == "falling":
-            edge = gpiod.EdgeEvent.Type.FALLING_EDGE
-        else:
+        if edge_type not in _EDGES:
             raise ValueError(f"Invalid edge type: {edge_type}, must be one of: " + "rising, falling")
-        self._wait_for_edge(edge, timeout)
+        self._wait_for_edge(getattr(gpiod.EdgeEvent.Type, _EDGES[edge_type]), timeout)
 
     @export
     def wait_for_inactive(self, timeout: float | None = None):
@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock, patch
 
+import anyio
 import pytest
 
 # Import the client classes directly
@@ -202,6 +203,14 @@ class TestDriverMethods:
         driver.off()
         driver._line.set_value.assert_called_with(18, mock_gpiod.line.Value.INACTIVE)
 
+        # Test cycle() method, off then on
+        mock_line.set_value.reset_mock()
+        anyio.run(driver.cycle, 0)
+        assert [c.args for c in mock_line.set_value.call_args_list] == [
+            (18, mock_gpiod.line.Value.INACTIVE),
+            (18, mock_gpiod.line.Value.ACTIVE),
+        ]
+
         # Test read_pin() method
         driver._line.get_value.return_value = mock_gpiod.line.Value.ACTIVE
         result = driver.read_pin()
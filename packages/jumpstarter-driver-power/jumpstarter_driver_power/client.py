@@ -5,10 +5,14 @@ import click
 
 from .common import PowerReading
 from jumpstarter.client import DriverClient
+from jumpstarter.client.core import DriverMethodNotFound
 from jumpstarter.client.decorators import driver_click_group
 
 
 class PowerClient(DriverClient):
+    # set once the driver is known not to export cycle, later cycles skip the probe
+    _cycle_unsupported: bool = False
+
     def on(self) -> None:
         """Power on the device."""
         self.call("on")
@@ -23,10 +27,19 @@ class PowerClient(DriverClient):
     def cycle(self, wait: int = 2):
         """Power cycle the device."""
         self.logger.info("Starting power cycle sequence")
-        self.off()
-        self.logger.info(f"Waiting {wait} seconds...")
-        time.sleep(wait)
-        self.on()
+        if not self._cycle_unsupported:
+            try:
+                # single call, the exporter waits between off and on
+                self.call("cycle", wait)
+            except DriverMethodNotFound:
+                # drivers (or exporters) without a cycle method, errors raised
+                # while cycling are not caught and must not trigger a second cycle
+                self._cycle_unsupported = True
+        if self._cycle_unsupported:
+            self.off()
+            self.logger.info(f"Waiting {wait} seconds...")
+            time.sleep(wait)
+            self.on()
         self.logger.info("Power cycle sequence complete")
 
     def read(self) -> Generator[PowerReading, None, None]:
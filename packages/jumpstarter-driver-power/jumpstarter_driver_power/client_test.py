@@ -1,9 +1,61 @@
 import logging
 import time
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from .driver import MockPower
+import pytest
+
+from .driver import MockPower, PowerInterface, SyncMockPower, VirtualPowerInterface
+from jumpstarter.client.core import DriverMethodNotImplemented
 from jumpstarter.common.utils import serve
+from jumpstarter.driver import Driver, export
+
+
+class OnOffPower(Driver):
+    def __post_init__(self):
+        if hasattr(super(), "__post_init__"):
+            super().__post_init__()
+        self._calls = []
+
+    @classmethod
+    def client(cls) -> str:
+        return "jumpstarter_driver_power.client.PowerClient"
+
+    @export
+    def on(self) -> None:
+        self._calls.append("on")
+
+    @export
+    def off(self) -> None:
+        self._calls.append("off")
+
+    @export
+    def calls(self) -> list[str]:
+        return self._calls
+
+
+class BrokenOnPower(OnOffPower, PowerInterface):
+    @export
+    def on(self) -> None:
+        self._calls.append("on")
+        raise NotImplementedError("relay stuck")
+
+    @export
+    def read(self):
+        yield from ()
+
+
+class VirtualOnOffPower(OnOffPower, VirtualPowerInterface):
+    @classmethod
+    def client(cls) -> str:
+        return "jumpstarter_driver_power.client.VirtualPowerClient"
+
+    @export
+    def off(self, destroy: bool = False) -> None:
+        self._calls.append(f"off destroy={destroy}")
+
+    @export
+    def read(self):
+        yield from ()
 
 
 def test_log_stream(monkeypatch):
@@ -18,3 +70,59 @@ def test_log_stream(monkeypatch):
             client.off()
             time.sleep(1)
             log.assert_called_with(logging.INFO, "power off")
+
+
+def test_cycle(monkeypatch):
+    with serve(MockPower()) as client:
+        log = MagicMock()
+        monkeypatch.setattr(client, "_AsyncDriverClient__log", log)
+        with client.log_stream():
+            client.cycle(wait=0)
+            time.sleep(1)  # to ensure log is flushed
+            assert [c.args for c in log.call_args_list if c.args[1].startswith("power")] == [
+                (logging.INFO, "power off"),
+                (logging.INFO, "power on"),
+            ]
+
+
+def test_cycle_sync(monkeypatch):
+    with serve(SyncMockPower()) as client:
+        log = MagicMock()
+        monkeypatch.setattr(client, "_AsyncDriverClient__log", log)
+        with client.log_stream():
+            client.cycle(wait=0)
+            time.sleep(1)  # to ensure log is flushed
+            assert [c.args for c in log.call_args_list if c.args[1].startswith("power")] == [
+                (logging.INFO, "power off"),
+                (logging.INFO, "power on"),
+            ]
+
+
+def test_cycle_error_not_retried():
+    # errors raised by the driver while cycling are not mistaken for a missing cycle method
+    with serve(BrokenOnPower()) as client:
+        with pytest.raises(DriverMethodNotImplemented, match="relay stuck"):
+            client.cycle(wait=0)
+        assert client.call("calls") == ["off", "on"]
+
+
+def test_cycle_fallback():
+    # drivers without a cycle method are cycled client side
+    with serve(OnOffPower()) as client:
+        with patch.object(client, "call", wraps=client.call) as mock_call:
+            client.cycle(wait=0)
+            client.cycle(wait=0)
+
+            # the missing cycle method is only probed once
+            assert [c.args for c in mock_call.call_args_list] == [("cycle", 0), ("off",), ("on",), ("off",), ("on",)]
+        assert client.call("calls") == ["off", "on", "off", "on"]
+
+
+def test_cycle_virtual():
+    # virtual power is cycled on the exporter without destroying the instance
+    with serve(VirtualOnOffPower()) as client:
+        with patch.object(client, "call", wraps=client.call) as mock_call:
+            client.cycle(wait=0)
+
+            assert [c.args for c in mock_call.call_args_list] == [("cycle", 0)]
+        assert client.call("calls") == ["off destroy=False", "on"]
@@ -1,7 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class PowerReading(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     voltage: float
     current: float
 
@@ -1,9 +1,36 @@
 from abc import ABCMeta, abstractmethod
 from collections.abc import AsyncGenerator, Generator
+from functools import partial
+from inspect import iscoroutinefunction
+
+from anyio import sleep, to_thread
 
 from .common import PowerReading
 from jumpstarter.driver import Driver, export
 
+# readings are immutable, so the mock drivers share them across calls
+_MOCK_READINGS = (
+    PowerReading(voltage=0.0, current=0.0),
+    PowerReading(voltage=5.0, current=2.0),
+)
+
+
+async def _call(method) -> None:
+    if iscoroutinefunction(method):
+        await method()
+    else:
+        await to_thread.run_sync(method)
+
+
+async def power_cycle(off, on, wait: int = 2) -> None:
+    """Call `off`, wait `wait` seconds and call `on`, running sync callables in a worker thread
+
+    Shared by the cycle exports of drivers that control power, so the sequence is defined once.
+    """
+    await _call(off)
+    await sleep(wait)
+    await _call(on)
+
 
 class PowerInterface(metaclass=ABCMeta):
     @classmethod
@@ -19,6 +46,11 @@ class PowerInterface(metaclass=ABCMeta):
     @abstractmethod
     async def read(self) -> AsyncGenerator[PowerReading, None]: ...
 
+    @export
+    async def cycle(self, wait: int = 2) -> None:
+        """Power cycle the device, waiting `wait` seconds between off and on"""
+        await power_cycle(self.off, self.on, wait)
+
 
 class VirtualPowerInterface(metaclass=ABCMeta):
     @classmethod
@@ -34,6 +66,11 @@ class VirtualPowerInterface(metaclass=ABCMeta):
     @abstractmethod
     async def read(self) -> AsyncGenerator[PowerReading, None]: ...
 
+    @export
+    async def cycle(self, wait: int = 2) -> None:
+        """Power cycle the device without destroying it, waiting `wait` seconds between off and on"""
+        await power_cycle(partial(self.off, False), self.on, wait)
+
 
 
 class MockPower(PowerInterface, Driver):
@@ -60,8 +97,8 @@ class MockPower(PowerInterface, Driver):
 
     @export
     async def read(self) -> AsyncGenerator[PowerReading, None]:
-        yield PowerReading(voltage=0.0, current=0.0)
-        yield PowerReading(voltage=5.0, current=2.0)
+        for reading in _MOCK_READINGS:
+            yield reading
 
 
 class SyncMockPower(PowerInterface, Driver):
@@ -88,5 +125,4 @@ class SyncMockPower(PowerInterface, Driver):
 
     @export
     def read(self) -> Generator[PowerReading, None]:
-        yield PowerReading(voltage=0.0, current=0.0)
-        yield PowerReading(voltage=5.0, current=2.0)
+        yield from _MOCK_READINGS
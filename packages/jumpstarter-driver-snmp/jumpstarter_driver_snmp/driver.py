@@ -1,9 +1,11 @@
 import asyncio
 import socket
+import threading
 from dataclasses import dataclass, field
 from enum import Enum, IntEnum
 from typing import Any, Dict, Tuple
 
+from jumpstarter_driver_power.driver import power_cycle
 from pysnmp.carrier.asyncio.dgram import udp
 from pysnmp.entity import config, engine
 from pysnmp.entity.rfc3413 import cmdgen
@@ -49,19 +51,28 @@ class SNMPServer(Driver):
     priv_protocol: PrivProtocol = field(default=PrivProtocol.NONE)
     priv_key: str | None = field(default=None)
     timeout: float = field(default=5.0)
+    ip_address: str | None = field(default=None, init=False, repr=False)
+    _snmp_engine: engine.SnmpEngine | None = field(default=None, init=False, repr=False)
+    # sync exports run in worker threads, commands must not share the engine concurrently
+    _snmp_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
 
     def __post_init__(self):
         if hasattr(super(), "__post_init__"):
             super().__post_init__()
 
-        try:
-            self.ip_address = socket.gethostbyname(self.host)
-            self.logger.debug(f"Resolved {self.host} to {self.ip_address}")
-        except socket.gaierror as e:
-            raise SNMPError(f"Failed to resolve hostname {self.host}: {e}") from e
-
         self.full_oid = tuple(int(x) for x in self.oid.split(".")) + (self.plug,)
 
+    def _resolve_host(self) -> str:
+        """Resolve the hostname on first use, the result is kept until an operation fails"""
+        if self.ip_address is None:
+            try:
+                self.ip_address = socket.gethostbyname(self.host)
+                self.logger.debug(f"Resolved {self.host} to {self.ip_address}")
+            except socket.gaierror as e:
+                raise SNMPError(f"Failed to resolve hostname {self.host}: {e}") from e
+
+        return self.ip_address
+
     def _setup_snmp(self):
         snmp_engine = engine.SnmpEngine()
 
@@ -104,15 +115,26 @@ class SNMPServer(Driver):
             snmp_engine,
             "my-target",
             udp.DOMAIN_NAME,
-            (self.ip_address, self.port),
+            (self._resolve_host(), self.port),
             "my-creds",
             timeout=int(self.timeout * 100),
         )
 
-        config.add_transport(snmp_engine, udp.DOMAIN_NAME, udp.UdpAsyncioTransport().open_client_mode())
-
         return snmp_engine
 
+    def _get_snmp_engine(self) -> engine.SnmpEngine:
+        """Return the SNMP engine, configuring it on first use
+
+        The engine (users, credentials and target) is reused across operations, only the
+        UDP transport is bound to the event loop of each operation and closed afterwards.
+        """
+        if self._snmp_engine is None:
+            self._snmp_engine = self._setup_snmp()
+
+        config.add_transport(self._snmp_engine, udp.DOMAIN_NAME, udp.UdpAsyncioTransport().open_client_mode())
+
+        return self._snmp_engine
+
     @classmethod
     def client(cls) -> str:
         return "jumpstarter_driver_snmp.client.SNMPServerClient"
@@ -149,48 +171,58 @@ class SNMPServer(Driver):
 
     async def _run_snmp_dispatcher(self, snmp_engine: engine.SnmpEngine, response_received: asyncio.Event):
         snmp_engine.open_dispatcher()
-        await response_received.wait()
-        snmp_engine.close_dispatcher()
+        try:
+            await response_received.wait()
+        finally:
+            snmp_engine.close_dispatcher()
 
     def _snmp_set(self, state: PowerState):
-        result = {"success": False, "error": None}
-        response_received = asyncio.Event()
-        loop = None
-        created_loop = False
+        with self._snmp_lock:
+            result = {"success": False, "error": None}
+            response_received = asyncio.Event()
+            loop = None
+            created_loop = False
+            snmp_engine = None
 
-        try:
-            self.logger.info(f"Sending power {state.name} command to {self.host}")
-            loop, created_loop = self._setup_event_loop()
-            snmp_engine = self._setup_snmp()
-            callback = self._create_snmp_callback(result, response_received)
-            cmdgen.SetCommandGenerator().send_varbinds(
-                snmp_engine,
-                "my-target",
-                None,
-                "",
-                [(self.full_oid, rfc1902.Integer(state.value))],
-                callback,
-            )
-
-            dispatcher_task = loop.create_task(self._run_snmp_dispatcher(snmp_engine, response_received))
             try:
-                loop.run_until_complete(asyncio.wait_for(dispatcher_task, self.timeout))
-            except asyncio.TimeoutError:
-                self.logger.warning(f"SNMP operation timed out after {self.timeout} seconds")
-                result["error"] = "SNMP operation timed out"
-
-            if not result["success"]:
-                raise SNMPError(result["error"] or "Unknown SNMP error")
-
-            return f"Power {state.name} command sent successfully"
+                self.logger.info(f"Sending power {state.name} command to {self.host}")
+                loop, created_loop = self._setup_event_loop()
+                snmp_engine = self._get_snmp_engine()
+                callback = self._create_snmp_callback(result, response_received)
+                cmdgen.SetCommandGenerator().send_varbinds(
+                    snmp_engine,
+                    "my-target",
+                    None,
+                    "",
+                    [(self.full_oid, rfc1902.Integer(state.value))],
+                    callback,
+                )
 
-        except Exception as e:
-            error_msg = f"SNMP set failed: {str(e)}"
-            self.logger.error(error_msg)
-            raise SNMPError(error_msg) from e
-        finally:
-            if created_loop and loop:
-                loop.close()
+                dispatcher_task = loop.create_task(self._run_snmp_dispatcher(snmp_engine, response_received))
+                try:
+                    loop.run_until_complete(asyncio.wait_for(dispatcher_task, self.timeout))
+                except asyncio.TimeoutError:
+                    self.logger.warning(f"SNMP operation timed out after {self.timeout} seconds")
+                    result["error"] = "SNMP operation timed out"
+
+                if not result["success"]:
+                    raise SNMPError(result["error"] or "Unknown SNMP error")
+
+                return f"Power {state.name} command sent successfully"
+
+            except Exception as e:
+                # resolve the hostname and configure the engine again on the next operation
+                self.ip_address = None
+                self._snmp_engine = None
+                error_msg = f"SNMP set failed: {str(e)}"
+                self.logger.error(error_msg)
+                raise SNMPError(error_msg) from e
+            finally:
+                if snmp_engine is not None:
+                    # release the transport if the dispatcher never ran
+                    snmp_engine.close_dispatcher()
+                if created_loop and loop:
+                    loop.close()
 
     @export
     def on(self):
@@ -202,7 +234,16 @@ class SNMPServer(Driver):
         """Turn power off"""
         return self._snmp_set(PowerState.OFF)
 
+    @export
+    async def cycle(self, wait: int = 2):
+        """Power cycle the device, waiting `wait` seconds between off and on"""
+        await power_cycle(self.off, self.on, wait)
+
     def close(self):
-        """No cleanup needed since engines are created per operation"""
+        """Release the SNMP engine"""
+        with self._snmp_lock:
+            if self._snmp_engine is not None:
+                self._snmp_engine.close_dispatcher()
+                self._snmp_engine = None
         if hasattr(super(), "close"):
             super().close()
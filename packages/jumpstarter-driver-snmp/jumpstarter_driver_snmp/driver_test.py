@@ -1,9 +1,14 @@
+import asyncio
+import socket
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 from pysnmp.entity import config as snmp_config
 
-from jumpstarter_driver_snmp.driver import AuthProtocol, PrivProtocol, SNMPServer
+from jumpstarter_driver_snmp.driver import AuthProtocol, PowerState, PrivProtocol, SNMPError, SNMPServer
+
+from jumpstarter.common.utils import serve
 
 
 class MockMibObject:
@@ -155,3 +160,112 @@ def test_power_off_command(mock_engine, mock_add_user):
         result = server.off()
         assert "Power OFF command sent successfully" in result
         mock_send.assert_called_once()
+
+
+@patch("pysnmp.entity.config.add_v3_user")
+@patch("pysnmp.entity.engine.SnmpEngine")
+def test_snmp_engine_reused(mock_engine, mock_add_user):
+    """Test that the SNMP engine is configured once and only the transport is set up per command"""
+    mock_engine.return_value = setup_mock_snmp_engine()
+
+    with (
+        patch("pysnmp.entity.rfc3413.cmdgen.SetCommandGenerator.send_varbinds") as mock_send,
+        patch("asyncio.get_running_loop", side_effect=RuntimeError),
+        patch("asyncio.new_event_loop"),
+        patch("asyncio.set_event_loop"),
+        patch("pysnmp.entity.config.add_target_parameters"),
+        patch("pysnmp.entity.config.add_target_address"),
+        patch("pysnmp.entity.config.add_transport") as mock_add_transport,
+    ):
+        server = SNMPServer(host="localhost", user="testuser", plug=1)
+
+        def side_effect(*args):
+            callback = args[-1]
+            callback(None, None, None, None, None, [], None)
+
+        mock_send.side_effect = side_effect
+
+        server.on()
+        server.off()
+
+        mock_engine.assert_called_once()
+        mock_add_user.assert_called_once()
+        assert mock_add_transport.call_count == 2
+
+        server.close()
+        mock_engine.return_value.close_dispatcher.assert_called()
+
+
+@patch("pysnmp.entity.config.add_v3_user")
+@patch("pysnmp.entity.engine.SnmpEngine")
+def test_hostname_resolved_lazily(mock_engine, mock_add_user):
+    """Test that the hostname is resolved on first use and again after a failure"""
+    mock_engine.return_value = setup_mock_snmp_engine()
+
+    with (
+        patch("socket.gethostbyname", side_effect=socket.gaierror("temporary failure")) as mock_resolve,
+        patch("asyncio.get_running_loop", side_effect=RuntimeError),
+        patch("asyncio.new_event_loop"),
+        patch("asyncio.set_event_loop"),
+        patch("pysnmp.entity.config.add_target_parameters"),
+        patch("pysnmp.entity.config.add_target_address"),
+        patch("pysnmp.entity.config.add_transport"),
+    ):
+        server = SNMPServer(host="pdu.example.com", user="testuser", plug=1)
+        mock_resolve.assert_not_called()
+
+        with pytest.raises(SNMPError, match="Failed to resolve hostname pdu.example.com"):
+            server.on()
+
+        mock_resolve.side_effect = None
+        mock_resolve.return_value = "192.0.2.1"
+
+        with patch("pysnmp.entity.rfc3413.cmdgen.SetCommandGenerator.send_varbinds") as mock_send:
+
+            def side_effect(*args):
+                callback = args[-1]
+                callback(None, None, None, None, None, [], None)
+
+            mock_send.side_effect = side_effect
+
+            server.on()
+            server.off()
+
+        assert server.ip_address == "192.0.2.1"
+        assert mock_resolve.call_count == 2
+
+
+def test_concurrent_commands():
+    """Test that concurrent commands from exporter worker threads do not share the engine mid-operation"""
+
+    def delayed_response(*args):
+        callback = args[-1]
+        asyncio.get_event_loop().call_later(0.3, callback, None, None, None, None, None, [], None)
+
+    with patch("pysnmp.entity.rfc3413.cmdgen.SetCommandGenerator.send_varbinds", side_effect=delayed_response):
+        server = SNMPServer(host="127.0.0.1", user="testuser", plug=1)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # configure the shared engine before the concurrent commands
+            executor.submit(server.on).result()
+            results = [executor.submit(server.on), executor.submit(server.off)]
+
+        assert results[0].result() == "Power ON command sent successfully"
+        assert results[1].result() == "Power OFF command sent successfully"
+
+        server.close()
+
+
+def test_power_cycle_on_exporter():
+    """Test that a power cycle runs on the exporter in a single driver call"""
+    server = SNMPServer(host="localhost", user="testuser", plug=1)
+
+    with (
+        patch.object(SNMPServer, "_snmp_set") as mock_set,
+        serve(server) as client,
+        patch.object(client, "call", wraps=client.call) as mock_call,
+    ):
+        client.cycle(wait=0)
+
+        mock_call.assert_called_once_with("cycle", 0)
+        assert [c.args[0] for c in mock_set.call_args_list] == [PowerState.OFF, PowerState.ON]
@@ -3,6 +3,7 @@ import shlex
 import subprocess
 import tempfile
 from dataclasses import dataclass
+from functools import cached_property
 from urllib.parse import urlparse
 
 import click
@@ -99,11 +100,13 @@ class SSHWrapperClient(CompositeClient):
         """Get the base SSH command"""
         return self.call("get_ssh_command")
 
-    @property
+    @cached_property
     def identity(self) -> str | None:
         """
         Get the SSH identity (private key) as a string.
 
+        The key is fetched from the driver once and reused by later runs.
+
         Returns:
             The SSH identity key content, or None if not configured.
 
@@ -707,3 +707,26 @@ def test_ssh_client_properties():
         assert client.username == "testuser"
         assert client.identity == TEST_SSH_KEY
         assert client.command == "my-ssh-command"
+
+
+def test_ssh_identity_fetched_once():
+    """Test that the identity is fetched from the driver once and reused across runs"""
+    instance = SSHWrapper(
+        children={"tcp": TcpNetwork(host="127.0.0.1", port=22)},
+        default_username="testuser",
+        ssh_identity=TEST_SSH_KEY,
+    )
+
+    with serve(instance) as client:
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+            with patch.object(client, 'call', wraps=client.call) as mock_call:
+                client.run(SSHCommandRunOptions(direct=False), ["hostname"])
+                client.run(SSHCommandRunOptions(direct=False), ["hostname"])
+
+                identity_calls = [c for c in mock_call.call_args_list if c.args == ("get_ssh_identity",)]
+                assert len(identity_calls) == 1
+
+            # Both runs should still pass a temporary identity file to ssh
+            assert all("-i" in c.args[0] for c in mock_run.call_args_list)
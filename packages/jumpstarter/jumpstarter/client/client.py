@@ -1,6 +1,5 @@
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 from contextlib import ExitStack, asynccontextmanager
-from graphlib import TopologicalSorter
 from uuid import UUID
 
 import grpc
@@ -27,42 +26,32 @@ async def client_from_channel(
     allow: list[str],
     unsafe: bool,
 ) -> DriverClient:
-    topo = defaultdict(list)
-    last_seen = {}
-    reports = {}
-    clients = OrderedDict()
-
     stub = MultipathExporterStub([channel])
 
     response = await stub.GetReport(empty_pb2.Empty())
 
-    for index, report in enumerate(response.reports):
-        topo[index] = []
-
-        last_seen[report.uuid] = index
-
-        if report.parent_uuid != "":
-            parent_index = last_seen[report.parent_uuid]
-            topo[parent_index].append(index)
-
-        reports[index] = report
+    # reports are ordered parents first, walking them backwards constructs
+    # every child before its parent without an explicit topological sort
+    children = defaultdict(list)
 
-    for index in TopologicalSorter(topo).static_order():
-        report = reports[index]
+    for report in reversed(response.reports):
+        # copy the protobuf map once, later lookups are then plain dict accesses
+        labels = dict(report.labels)
 
-        client_class = import_class(report.labels["jumpstarter.dev/client"], allow, unsafe)
+        client_class = import_class(labels["jumpstarter.dev/client"], allow, unsafe)
 
         client = client_class(
             uuid=UUID(report.uuid),
-            labels=report.labels,
+            labels=labels,
             stub=stub,
             portal=portal,
             stack=stack.enter_context(ExitStack()),
-            children={reports[k].labels["jumpstarter.dev/name"]: clients[k] for k in topo[index]},
+            children=dict(reversed(children.pop(report.uuid, []))),
             description=getattr(report, "description", None) or None,
             methods_description=getattr(report, "methods_description", {}) or {},
         )
 
-        clients[index] = client
+        if report.parent_uuid != "":
+            children[report.parent_uuid].append((labels["jumpstarter.dev/name"], client))
 
-    return clients.popitem(last=True)[1]
+    return client
@@ -42,6 +42,12 @@ class DriverMethodNotImplemented(DriverError, NotImplementedError):
     """
 
 
+class DriverMethodNotFound(DriverMethodNotImplemented):
+    """
+    Raised when a driver method does not exist on the driver
+    """
+
+
 class DriverInvalidArgument(DriverError, ValueError):
     """
     Raised when a driver method is called with invalid arguments
@@ -90,7 +96,7 @@ class AsyncDriverClient(
         except AioRpcError as e:
             match e.code():
                 case StatusCode.NOT_FOUND:
-                    raise DriverMethodNotImplemented(e.details()) from None
+                    raise DriverMethodNotFound(e.details()) from None
                 case StatusCode.UNIMPLEMENTED:
                     raise DriverMethodNotImplemented(e.details()) from None
                 case StatusCode.INVALID_ARGUMENT:
@@ -116,6 +122,8 @@ class AsyncDriverClient(
                 yield decode_value(response.result)
         except AioRpcError as e:
             match e.code():
+                case StatusCode.NOT_FOUND:
+                    raise DriverMethodNotFound(e.details()) from None
                 case StatusCode.UNIMPLEMENTED:
                     raise DriverMethodNotImplemented(e.details()) from None
                 case StatusCode.INVALID_ARGUMENT:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import json
-from collections import OrderedDict
 from dataclasses import InitVar, dataclass, field
 from datetime import datetime, timedelta
 from types import SimpleNamespace
@@ -469,7 +468,7 @@ class MultipathExporterStub:
 
     channels: InitVar[list[Channel]]
 
-    __stubs: dict[Channel, Any] = field(init=False, default_factory=OrderedDict)
+    __stubs: dict[Channel, Any] = field(init=False, default_factory=dict)
 
     def __post_init__(self, channels):
         for channel in channels: